@@ -16,29 +16,79 @@
 # - The module uses platform-specific configurations to select the appropriate window management implementation.
 # 
 # Please refer to the documentation for installation and usage instructions.
+import sys
 import platform
-system_name = platform.system()
+# sys.platform is a constant baked in at interpreter build time, so the
+# common cases avoid platform.system(), which may probe uname on first use.
+if sys.platform.startswith("win"):
+    system_name = "Windows"
+elif sys.platform.startswith("linux"):
+    system_name = "Linux"
+else:
+    system_name = platform.system()
 character = "\r\n" if system_name == "Windows" else "\n"
 spacing = "GBK" if system_name == "Windows" else "utf-8"
 
-from .utils import is_x11_environment, configure_xhost
-if is_x11_environment():
-    configure_xhost(enable=True)
+# Enable xhost for X11 environments. The DISPLAY check mirrors
+# utils.is_x11_environment, inlined here so importing the package does not
+# pull in cv2 through core.utils before anything graphical is needed.
+import os
+_display = os.environ.get("DISPLAY")
+if _display is not None and _display.startswith(":"):
+    os.system("xhost +")
+del _display
 
+# The submodules below are imported lazily (PEP 562): cv2, mss, pyautogui and
+# the OCR/X11 stacks each cost tens to hundreds of milliseconds and tens of MB
+# to load, and most callers only use one or two of these components.
+import importlib
 import warnings
-if system_name == "Windows":
-    from .windows_window import WindowManager
-elif system_name != "Linux":
-    warnings.warn("Types of operating systems not supported at this time.")
-else:
-    from .linux_window import WindowManager
 
-from .defs import ScreenHelperDefs
-from .image_matcher import ImageMatcher
-from .logger import LoggerController
-from .ocr import OCRRecognizer
-from .text_rec import TextRec
-from .screen import ScreenHelper
-from .mouse import MouseController
-from .keyboard import KeyboardController
-from .toolkit import GraphicToolkit, ScreenToolkit
\ No newline at end of file
+__all__ = [
+    "WindowManager",
+    "ScreenHelperDefs",
+    "ImageMatcher",
+    "LoggerController",
+    "FileManager",
+    "OCRRecognizer",
+    "TextRec",
+    "ScreenHelper",
+    "MouseController",
+    "KeyboardController",
+    "GraphicToolkit",
+    "ScreenToolkit",
+]
+
+_LAZY_IMPORTS = {
+    "ScreenHelperDefs": ".defs",
+    "ImageMatcher": ".image_matcher",
+    "LoggerController": ".logger",
+    "FileManager": ".file_manager",
+    "OCRRecognizer": ".ocr",
+    "TextRec": ".text_rec",
+    "ScreenHelper": ".screen",
+    "MouseController": ".mouse",
+    "KeyboardController": ".keyboard",
+    "GraphicToolkit": ".toolkit",
+    "ScreenToolkit": ".toolkit",
+}
+
+def __getattr__(name):
+    if name == "WindowManager":
+        if system_name == "Windows":
+            module = importlib.import_module(".windows_window", __name__)
+        elif system_name == "Linux":
+            module = importlib.import_module(".linux_window", __name__)
+        else:
+            warnings.warn("Types of operating systems not supported at this time.")
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    elif name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
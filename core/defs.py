@@ -9,6 +9,7 @@
 # - Hotkey definitions like CTRL, ALT, SHIFT, and others.
 # - Window management actions like open, close, maximize, and minimize.
 # - Text manipulation commands such as send, find, copy, paste, and clear text.
+import sys
 
 class ScreenHelperDefs:
     # General threshold for image matching
@@ -57,17 +58,13 @@ class ScreenHelperDefs:
     RIGHT = "right"
     MIDDLE = "middle"
 
-    # Hotkey definitions
+    # Hotkey definitions (the arrow keys reuse the direction constants above)
     CTRL = "ctrl"
     ALT = "alt"
     SHIFT = "shift"
     ENTER = "enter"
     ESC = "esc"
     TAB = "tab"
-    LEFT = "left"
-    RIGHT = "right"
-    UP = "up"
-    DOWN = "down"
 
     # Window state definitions
     OPEN = "open"
@@ -83,3 +80,10 @@ class ScreenHelperDefs:
     COPY_TEXT = "copy_text"
     PASTE_TEXT = "paste_text"
     CLEAR_TEXT = "clear_text"
+
+# Intern the string constants so dispatch-table lookups and equality checks
+# against them can short-circuit on pointer identity.
+for _name, _value in list(vars(ScreenHelperDefs).items()):
+    if not _name.startswith("__") and isinstance(_value, str):
+        setattr(ScreenHelperDefs, _name, sys.intern(_value))
+del _name, _value
@@ -0,0 +1,97 @@
+import os
+import atexit
+from typing import Dict
+
+# File descriptors cached per path for append-heavy workloads (e.g. run
+# logs): O_APPEND keeps each write atomic, and reusing the descriptor cuts
+# the per-message syscalls from open/write/close down to a single write.
+_append_fds: Dict[str, int] = {}
+
+def _close_append_fds() -> None:
+    while _append_fds:
+        _, fd = _append_fds.popitem()
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+atexit.register(_close_append_fds)
+
+class FileManager:
+    """
+    File operation helper for the automation framework.
+
+    This class provides methods for reading and writing text files and for
+    appending to log-style files through a cached file descriptor.
+
+    Methods:
+        - read_file: Reads the full content of a text file.
+        - write_file: Writes content to a text file, replacing it.
+        - append_file: Appends content to a file via a cached descriptor.
+        - close_file: Closes the cached descriptor for a path, if any.
+    """
+
+    @staticmethod
+    def read_file(file_path: str, encoding: str = "utf-8") -> str:
+        """
+        Read the full content of a text file.
+
+        :param file_path: Path of the file to read.
+        :param encoding: Text encoding of the file, default is utf-8.
+        :return: The file content as a string.
+        """
+        try:
+            with open(file_path, "r", encoding=encoding) as f:
+                return f.read()
+        except OSError as e:
+            raise RuntimeError(f"Error reading file {file_path}: {e}")
+
+    @staticmethod
+    def write_file(file_path: str, content: str, encoding: str = "utf-8") -> None:
+        """
+        Write content to a text file, replacing any existing content.
+
+        :param file_path: Path of the file to write.
+        :param content: The content to write.
+        :param encoding: Text encoding of the file, default is utf-8.
+        """
+        try:
+            with open(file_path, "w", encoding=encoding) as f:
+                f.write(content)
+        except OSError as e:
+            raise RuntimeError(f"Error writing file {file_path}: {e}")
+
+    @staticmethod
+    def append_file(file_path: str, content: str, encoding: str = "utf-8") -> None:
+        """
+        Append content to a file using a descriptor cached per path, so
+        repeated appends cost one write syscall instead of open/write/close.
+        Descriptors are closed automatically at interpreter exit.
+
+        :param file_path: Path of the file to append to.
+        :param content: The content to append.
+        :param encoding: Text encoding used for the content, default is utf-8.
+        """
+        fd = _append_fds.get(file_path)
+        try:
+            if fd is None:
+                fd = os.open(file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                _append_fds[file_path] = fd
+            os.write(fd, content.encode(encoding))
+        except OSError as e:
+            raise RuntimeError(f"Error appending to file {file_path}: {e}")
+
+    @staticmethod
+    def close_file(file_path: str) -> None:
+        """
+        Close the cached append descriptor for a path, if one is open.
+        Useful when a file must be removed or reopened elsewhere.
+
+        :param file_path: Path whose cached descriptor should be closed.
+        """
+        fd = _append_fds.pop(file_path, None)
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
@@ -1,8 +1,184 @@
 import cv2
 import numpy as np
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# OpenCV transparently dispatches matchTemplate to OpenCL when inputs are
+# UMat; only worth the host->device copy on reasonably large screens. The
+# use check happens per call so cv2.ocl.setUseOpenCL(False) acts as an
+# opt-out (e.g. to avoid the first-call kernel-compile stall).
+_HAVE_OPENCL = cv2.ocl.haveOpenCL()
+_OPENCL_MIN_PIXELS = 512 * 512
+
+# Below this size a downsampled template matches almost anything, flooding
+# the coarse pyramid pass with false candidates that all need refining.
+_PYRAMID_MIN_TEMPLATE_SIZE = 20
+
+def _match_template(screen: np.ndarray, template: np.ndarray, method: int, dst: np.ndarray = None) -> np.ndarray:
+    """
+    Run cv2.matchTemplate, offloading to the GPU via the OpenCL T-API when
+    available and the screen is large enough to amortize the transfer.
+
+    :param screen: The screen image to search in.
+    :param template: The template image to search for.
+    :param method: The method used for template matching.
+    :param dst: Optional preallocated result buffer of the right shape, reused
+        to avoid a fresh multi-MB allocation per call.
+    :return: The match result matrix as a numpy array.
+    """
+    # matchTemplate's SIMD paths want C-contiguous input; region slices and
+    # some preprocess outputs are not. float64 (e.g. from numpy arithmetic)
+    # is not accepted by matchTemplate at all, so narrow it to float32.
+    if not screen.flags["C_CONTIGUOUS"]:
+        screen = np.ascontiguousarray(screen)
+    if not template.flags["C_CONTIGUOUS"]:
+        template = np.ascontiguousarray(template)
+    if screen.dtype == np.float64:
+        screen = screen.astype(np.float32)
+    if template.dtype == np.float64:
+        template = template.astype(np.float32)
+    if _HAVE_OPENCL and screen.size >= _OPENCL_MIN_PIXELS and cv2.ocl.useOpenCL():
+        try:
+            return cv2.matchTemplate(cv2.UMat(screen), cv2.UMat(template), method).get()
+        except cv2.error:
+            pass
+    if dst is not None:
+        return cv2.matchTemplate(screen, template, method, dst)
+    return cv2.matchTemplate(screen, template, method)
+
+def _match_template_strips(
+        screen: np.ndarray,
+        template: np.ndarray,
+        method: int,
+        threads: int
+    ) -> np.ndarray:
+    """
+    Run matchTemplate over horizontal screen strips in a thread pool.
+
+    Every matching method scores each window independently, so strips
+    overlapping by template_height - 1 rows stitch into exactly the
+    full-screen result; cv2.matchTemplate releases the GIL, letting the
+    strips run on separate cores.
+
+    :param screen: The screen image to search in.
+    :param template: The template image to search for.
+    :param method: The method used for template matching.
+    :param threads: The number of strips/worker threads to use.
+    :return: The match result matrix as a numpy array.
+    """
+    template_height = template.shape[0]
+    result_height = screen.shape[0] - template_height + 1
+    # Strips thinner than the template just add overhead.
+    threads = min(threads, max(result_height // template_height, 1))
+    if threads <= 1:
+        return _match_template(screen, template, method)
+    rows_per_strip = (result_height + threads - 1) // threads
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        futures = []
+        for strip_index in range(threads):
+            row_start = strip_index * rows_per_strip
+            if row_start >= result_height:
+                break
+            row_end = min(row_start + rows_per_strip, result_height)
+            strip = screen[row_start:row_end + template_height - 1]
+            futures.append(pool.submit(cv2.matchTemplate, strip, template, method))
+        strip_results = [future.result() for future in futures]
+    return np.vstack(strip_results)
+
+def _build_pyramid(image: np.ndarray, levels: int) -> List[np.ndarray]:
+    """
+    Build a Gaussian pyramid with cv2.pyrDown, finest level first.
+
+    :param image: The image to downsample.
+    :param levels: The number of pyrDown steps to apply.
+    :return: A list of levels + 1 images, from full resolution to coarsest.
+    """
+    pyramid = [image]
+    for _ in range(levels):
+        image = cv2.pyrDown(image)
+        pyramid.append(image)
+    return pyramid
+
+def _ncc_from_integrals(
+        screen: np.ndarray,
+        screen_sum: np.ndarray,
+        screen_sumsq: np.ndarray,
+        template: np.ndarray
+    ) -> np.ndarray:
+    """
+    TM_CCOEFF_NORMED result map using precomputed screen integral images.
+
+    The normalization denominator only depends on per-window screen sums,
+    so when several templates are matched against the same screen the
+    integrals are computed once and each template costs a single TM_CCORR
+    pass (the numerator) plus cheap slicing arithmetic.
+
+    :param screen: The screen image as a float32 single-channel array.
+    :param screen_sum: cv2.integral sum image of the screen.
+    :param screen_sumsq: cv2.integral2 squared-sum image of the screen.
+    :param template: The template image as a single-channel array.
+    :return: The match result matrix, equivalent to cv2.matchTemplate with TM_CCOEFF_NORMED.
+    """
+    template_height, template_width = template.shape[:2]
+    pixel_count = template_height * template_width
+    zero_mean_template = template.astype(np.float32)
+    zero_mean_template -= zero_mean_template.mean()
+    template_norm = float(np.sqrt((zero_mean_template * zero_mean_template).sum()))
+
+    # sum(T' * W) == sum((T - mean(T)) * (W - mean(W))) because sum(T') == 0.
+    numerator = cv2.matchTemplate(screen, zero_mean_template, cv2.TM_CCORR)
+    window_sum = (
+        screen_sum[template_height:, template_width:]
+        - screen_sum[:-template_height, template_width:]
+        - screen_sum[template_height:, :-template_width]
+        + screen_sum[:-template_height, :-template_width]
+    )
+    window_sumsq = (
+        screen_sumsq[template_height:, template_width:]
+        - screen_sumsq[:-template_height, template_width:]
+        - screen_sumsq[template_height:, :-template_width]
+        + screen_sumsq[:-template_height, :-template_width]
+    )
+    window_variance = np.maximum(window_sumsq - window_sum * window_sum / pixel_count, 0.0)
+    denominator = np.sqrt(window_variance) * template_norm
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = numerator / denominator
+    result[denominator < 1e-6] = 0.0
+    return result.astype(np.float32)
+
+def _nearby_keep_mask(positions: np.ndarray, min_distance: int) -> np.ndarray:
+    """
+    Greedy proximity filter over an (N, 2) array of match centers.
+
+    :param positions: Match centers as a contiguous (N, 2) int32 array.
+    :param min_distance: Minimum per-axis distance between two kept matches.
+    :return: A boolean mask marking the matches to keep.
+    """
+    count = positions.shape[0]
+    keep = np.ones(count, dtype=np.bool_)
+    for i in range(count):
+        for j in range(i):
+            if keep[j] and \
+                abs(positions[i, 0] - positions[j, 0]) < min_distance and \
+                abs(positions[i, 1] - positions[j, 1]) < min_distance:
+                keep[i] = False
+                break
+    return keep
+
+if njit is not None:
+    _nearby_keep_mask = njit(cache=True, nogil=True)(_nearby_keep_mask)
 
 class ImageMatcher:
+    def __init__(self):
+        # Result buffer handed to matchTemplate as dst; for a fixed screen and
+        # template size this turns a multi-MB float32 allocation per frame
+        # into a one-time allocation.
+        self._result_buffer: Optional[np.ndarray] = None
     def find_template_locations(
             self, 
             original_image: np.ndarray,
@@ -10,18 +186,40 @@ class ImageMatcher:
             resized_image: np.ndarray = None, 
             resized_template: np.ndarray = None, 
             method: int = cv2.TM_CCOEFF_NORMED,
-            threshold: float = None
+            threshold: float = None,
+            grayscale: bool = False,
+            search_region: Optional[Tuple[int, int, int, int]] = None,
+            nms_distance: Optional[int] = None,
+            threads: int = 1,
+            mask: Optional[np.ndarray] = None
         ) -> List[Dict[str, any]]:
         """
-        Find all locations of the template in the screen image. 
+        Find all locations of the template in the screen image.
         If resized images are not provided, use the original images for matching.
-        
+
         :param resized_image: The screen image after resizing (scaled image), or None to use original_image.
         :param resized_template: The template image after resizing (scaled image), or None to use original_template.
         :param original_image: The original, unresized screen image.
         :param original_template: The original, unresized template image.
         :param method: The method used for template matching (default: cv2.TM_CCOEFF_NORMED).
         :param threshold: The minimum correlation value to consider a match as valid.
+        :param grayscale: If True, convert screen and template to grayscale before matching,
+            cutting the bytes the correlation touches to a third. Match scores may differ
+            slightly from color matching, so this is opt-in.
+        :param search_region: Optional (x, y, width, height) region, in original-image
+            coordinates, to restrict the search to. Returned positions stay in
+            full-image coordinates.
+        :param nms_distance: Optional suppression radius in result-map pixels. When set,
+            only local score extrema within that radius are returned, so clustered
+            above-threshold pixels collapse to one match per peak and a later
+            filter_nearby_matches pass becomes unnecessary.
+        :param threads: Number of worker threads for the correlation. With more than
+            one, the screen is split into overlapping horizontal strips matched in
+            parallel (matchTemplate releases the GIL); results are identical.
+        :param mask: Optional template mask (same height/width as the template,
+            uint8 or float32) so transparent template regions are ignored. Only
+            the methods OpenCV supports masks for (TM_SQDIFF, TM_CCORR_NORMED,
+            TM_CCOEFF_NORMED) may be used with it.
         :return: A list of dictionaries containing position, size, and match details for each match.
         
         Raises:
@@ -33,8 +231,41 @@ class ImageMatcher:
         screen_to_use = resized_image if resized_image is not None else original_image
         template_to_use = resized_template if resized_template is not None else original_template
 
+        if grayscale:
+            if screen_to_use.ndim == 3:
+                screen_to_use = cv2.cvtColor(screen_to_use, cv2.COLOR_BGR2GRAY)
+            if template_to_use.ndim == 3:
+                template_to_use = cv2.cvtColor(template_to_use, cv2.COLOR_BGR2GRAY)
+
         original_image_height, original_image_width = original_image.shape[:2]
         original_template_height, original_template_width = original_template.shape[:2]
+
+        if screen_to_use.shape == template_to_use.shape and search_region is None and method == cv2.TM_CCOEFF_NORMED and mask is None:
+            # Whole-frame comparison: matchTemplate would slide exactly one
+            # window, so compute the zero-mean correlation directly.
+            flat_screen = screen_to_use.reshape(-1).astype(np.float32)
+            flat_template = template_to_use.reshape(-1).astype(np.float32)
+            flat_screen -= flat_screen.mean()
+            flat_template -= flat_template.mean()
+            denominator = float(np.sqrt(np.dot(flat_screen, flat_screen) * np.dot(flat_template, flat_template)))
+            if denominator > 0.0:
+                score = float(np.dot(flat_screen, flat_template)) / denominator
+            else:
+                # Uniform frame or template: the zero-mean correlation is
+                # undefined, but matchTemplate defines the case (identical
+                # constant frames score 1.0), so defer to it rather than
+                # inventing a score.
+                score = float(cv2.matchTemplate(screen_to_use, template_to_use, method)[0, 0])
+            if score < threshold:
+                raise RuntimeError(f"Match failed, current max value {score} did not reach the defined threshold {threshold}")
+            return [
+                {
+                    "position": (original_template_width // 2, original_template_height // 2),
+                    "dimensions": (original_template_width, original_template_height),
+                    "threshold": threshold
+                }
+            ]
+
         screen_height, screen_width = screen_to_use.shape[:2]
         template_height, template_width = template_to_use.shape[:2]
 
@@ -43,35 +274,386 @@ class ImageMatcher:
         scale_x_template = template_width / original_template_width
         scale_y_template = template_height / original_template_height
 
-        match_result = cv2.matchTemplate(screen_to_use, template_to_use, method)
-        min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(match_result)
+        region_x_offset = 0
+        region_y_offset = 0
+        if search_region is not None:
+            region_x, region_y, region_width, region_height = search_region
+            region_x_offset = int(region_x * scale_x_screen)
+            region_y_offset = int(region_y * scale_y_screen)
+            region_x_end = int((region_x + region_width) * scale_x_screen)
+            region_y_end = int((region_y + region_height) * scale_y_screen)
+            screen_to_use = screen_to_use[region_y_offset:region_y_end, region_x_offset:region_x_end]
+
+        if mask is not None:
+            # Masked matching takes the plain path: the strip/OpenCL/buffer
+            # helpers do not thread the mask through. Fully- or mostly-masked
+            # windows can produce NaN or infinite scores; rewrite all of them
+            # to a value that always fails the threshold so minMaxLoc and the
+            # comparisons stay defined.
+            match_result = cv2.matchTemplate(screen_to_use, template_to_use, method, mask=mask)
+            if method in [cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED]:
+                failing_value = threshold + 1.0
+            else:
+                failing_value = threshold - 1.0
+            np.nan_to_num(match_result, copy=False, nan=failing_value,
+                          posinf=failing_value, neginf=failing_value)
+        elif threads > 1:
+            match_result = _match_template_strips(screen_to_use, template_to_use, method, threads)
+        else:
+            result_shape = (
+                screen_to_use.shape[0] - template_to_use.shape[0] + 1,
+                screen_to_use.shape[1] - template_to_use.shape[1] + 1
+            )
+            if self._result_buffer is None or self._result_buffer.shape != result_shape:
+                self._result_buffer = np.empty(result_shape, dtype=np.float32)
+            match_result = _match_template(screen_to_use, template_to_use, method, dst=self._result_buffer)
 
+        # One SIMD minMaxLoc pass settles the (frequent, when polling for a
+        # UI element) no-match case before any mask or coordinate arrays are
+        # allocated, and provides the extremum for the error message.
+        min_value, max_value, _, _ = cv2.minMaxLoc(match_result)
         if method in [cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED]:
-            if min_val > threshold:
-                raise RuntimeError(f"Match failed, current max value {min_val} did not reach the defined threshold {threshold}")
+            if min_value > threshold:
+                raise RuntimeError(f"Match failed, current max value {min_value} did not reach the defined threshold {threshold}")
+            match_mask = match_result <= threshold
+            if nms_distance:
+                # Keep only local minima: a single erode finds the neighborhood
+                # minimum for every pixel in one vectorized pass.
+                kernel = np.ones((2 * nms_distance + 1, 2 * nms_distance + 1), np.uint8)
+                match_mask &= match_result == cv2.erode(match_result, kernel)
+            match_y_coords, match_x_coords = np.where(match_mask)
         else:
-            if max_val < threshold:
-                raise RuntimeError(f"Match failed, current max value {max_val} did not reach the defined threshold {threshold}")
-        
-        match_locations = []
-        match_y_coords, match_x_coords = np.where(match_result >= threshold)
-        
-        for x, y in zip(match_x_coords, match_y_coords):
-            original_x = int(x / scale_x_screen)
-            original_y = int(y / scale_y_screen)
-            original_template_width = int(template_width / scale_x_template)
-            original_template_height = int(template_height / scale_y_template)
-
-            center_x = int(original_x + original_template_width // 2)
-            center_y = int(original_y + original_template_height // 2)
-            match_locations.append(
-                {
-                    "position": (center_x, center_y),
-                    "dimensions": (original_template_width, original_template_height),
-                    "threshold": threshold
-                }
+            if max_value < threshold:
+                raise RuntimeError(f"Match failed, current max value {max_value} did not reach the defined threshold {threshold}")
+            match_mask = match_result >= threshold
+            if nms_distance:
+                kernel = np.ones((2 * nms_distance + 1, 2 * nms_distance + 1), np.uint8)
+                match_mask &= match_result == cv2.dilate(match_result, kernel)
+            match_y_coords, match_x_coords = np.where(match_mask)
+
+        original_template_width = int(template_width / scale_x_template)
+        original_template_height = int(template_height / scale_y_template)
+        dimensions = (original_template_width, original_template_height)
+
+        if scale_x_screen == 1.0 and scale_y_screen == 1.0:
+            # Unscaled match (the common case): pure integer adds, no float
+            # round trip or extra cast needed.
+            center_x_coords = (match_x_coords + (region_x_offset + original_template_width // 2)).tolist()
+            center_y_coords = (match_y_coords + (region_y_offset + original_template_height // 2)).tolist()
+        else:
+            # Multiply by the reciprocal instead of dividing per element; float
+            # division is several times the cost of a multiply on the whole array.
+            inv_scale_x_screen = 1.0 / scale_x_screen
+            inv_scale_y_screen = 1.0 / scale_y_screen
+            center_x_coords = (((match_x_coords + region_x_offset) * inv_scale_x_screen).astype(np.int64) + original_template_width // 2).tolist()
+            center_y_coords = (((match_y_coords + region_y_offset) * inv_scale_y_screen).astype(np.int64) + original_template_height // 2).tolist()
+        return [
+            {
+                "position": (center_x, center_y),
+                "dimensions": dimensions,
+                "threshold": threshold
+            }
+            for center_x, center_y in zip(center_x_coords, center_y_coords)
+        ]
+    def find_best_template_location(
+            self,
+            original_image: np.ndarray,
+            original_template: np.ndarray,
+            method: int = cv2.TM_SQDIFF_NORMED,
+            threshold: float = None,
+            grayscale: bool = False
+        ) -> Dict[str, any]:
+        """
+        Return only the single best match, for "is the template there?"
+        queries. cv2.minMaxLoc scans the result map once instead of
+        enumerating every above-threshold pixel, and the default
+        TM_SQDIFF_NORMED skips the mean-subtraction work of
+        TM_CCOEFF_NORMED (note: for the SQDIFF methods lower is better,
+        so thresholds are upper bounds here).
+
+        :param original_image: The original, unresized screen image.
+        :param original_template: The original, unresized template image.
+        :param method: The method used for template matching (default: cv2.TM_SQDIFF_NORMED).
+        :param threshold: The score the best match must reach to be considered valid.
+        :param grayscale: If True, convert screen and template to grayscale before matching.
+        :return: A dictionary containing position, size, and score of the best match.
+
+        Raises:
+        RuntimeError: If the best match does not reach the threshold, or if threshold is not provided.
+        """
+        if threshold is None:
+            raise RuntimeError("threshold is required for template matching.")
+
+        screen_to_use = original_image
+        template_to_use = original_template
+        if grayscale:
+            if screen_to_use.ndim == 3:
+                screen_to_use = cv2.cvtColor(screen_to_use, cv2.COLOR_BGR2GRAY)
+            if template_to_use.ndim == 3:
+                template_to_use = cv2.cvtColor(template_to_use, cv2.COLOR_BGR2GRAY)
+
+        match_result = _match_template(screen_to_use, template_to_use, method)
+        min_value, max_value, min_location, max_location = cv2.minMaxLoc(match_result)
+        if method in [cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED]:
+            best_value, best_location = min_value, min_location
+            if best_value > threshold:
+                raise RuntimeError(f"Match failed, current max value {best_value} did not reach the defined threshold {threshold}")
+        else:
+            best_value, best_location = max_value, max_location
+            if best_value < threshold:
+                raise RuntimeError(f"Match failed, current max value {best_value} did not reach the defined threshold {threshold}")
+
+        template_height, template_width = template_to_use.shape[:2]
+        return {
+            "position": (best_location[0] + template_width // 2, best_location[1] + template_height // 2),
+            "dimensions": (template_width, template_height),
+            "threshold": threshold,
+            "score": best_value
+        }
+    def find_template_locations_pyramid(
+            self,
+            original_image: np.ndarray,
+            original_template: np.ndarray,
+            method: int = cv2.TM_CCOEFF_NORMED,
+            threshold: float = None,
+            grayscale: bool = False,
+            levels: int = 2,
+            coarse_slack: float = 0.1
+        ) -> List[Dict[str, any]]:
+        """
+        Coarse-to-fine template matching over a Gaussian pyramid.
+
+        A full-resolution matchTemplate scans O(W*H*w*h) pixels; on large
+        screens the coarse pass touches a fraction of that, and only the
+        candidate regions it finds are re-matched at full resolution. The
+        coarse pass uses a slightly relaxed threshold so true matches are
+        not lost to downsampling blur; the final threshold is applied on
+        the full-resolution refinement.
+
+        :param original_image: The original, unresized screen image.
+        :param original_template: The original, unresized template image.
+        :param method: The method used for template matching (default: cv2.TM_CCOEFF_NORMED).
+        :param threshold: The minimum correlation value to consider a match as valid.
+        :param grayscale: If True, convert screen and template to grayscale before matching.
+        :param levels: The number of pyrDown steps for the coarse pass (default: 2, i.e. 1/4 resolution).
+        :param coarse_slack: How much the threshold is relaxed at the coarse level.
+        :return: A list of dictionaries containing position, size, and match details for each match.
+
+        Raises:
+        RuntimeError: If no matches are found, or if threshold is not provided.
+        """
+        if threshold is None:
+            raise RuntimeError("threshold is required for template matching.")
+
+        screen_to_use = original_image
+        template_to_use = original_template
+        if grayscale:
+            if screen_to_use.ndim == 3:
+                screen_to_use = cv2.cvtColor(screen_to_use, cv2.COLOR_BGR2GRAY)
+            if template_to_use.ndim == 3:
+                template_to_use = cv2.cvtColor(template_to_use, cv2.COLOR_BGR2GRAY)
+
+        template_height, template_width = template_to_use.shape[:2]
+        # On screens past ~2MP (QHD/4K) deepen the coarse pass until its
+        # longest side is near 720px; each extra level quarters the pixels
+        # the coarse matchTemplate touches.
+        if screen_to_use.shape[0] * screen_to_use.shape[1] > 2_000_000:
+            longest_side = max(screen_to_use.shape[:2])
+            while longest_side >> levels > 720:
+                levels += 1
+        # Each pyrDown halves the template; stop before it shrinks below the
+        # size where coarse matches stay discriminative.
+        while levels > 0 and min(template_height, template_width) >> levels < _PYRAMID_MIN_TEMPLATE_SIZE:
+            levels -= 1
+        if levels == 0:
+            return self.find_template_locations(
+                original_image=original_image,
+                original_template=original_template,
+                resized_image=screen_to_use,
+                resized_template=template_to_use,
+                method=method,
+                threshold=threshold
             )
-        return match_locations
+
+        coarse_screen = _build_pyramid(screen_to_use, levels)[-1]
+        coarse_template = _build_pyramid(template_to_use, levels)[-1]
+        coarse_result = _match_template(coarse_screen, coarse_template, method)
+        if method in [cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED]:
+            coarse_mask = (coarse_result <= threshold + coarse_slack).astype(np.uint8)
+        else:
+            coarse_mask = (coarse_result >= threshold - coarse_slack).astype(np.uint8)
+        if not coarse_mask.any():
+            raise RuntimeError(f"Match failed, no candidate region reached the defined threshold {threshold} at the coarse level")
+        # Close small gaps so clusters of adjacent candidate pixels (typical
+        # on text-heavy screens) refine as one window instead of one
+        # matchTemplate call per pixel.
+        coarse_mask = cv2.morphologyEx(coarse_mask, cv2.MORPH_CLOSE, np.ones((3, 3), np.uint8))
+        component_count, _, component_stats, _ = cv2.connectedComponentsWithStats(coarse_mask)
+
+        scale = 1 << levels
+        screen_height, screen_width = screen_to_use.shape[:2]
+        pad = scale
+        seen_positions = set()
+        matching_results = []
+        for component in range(1, component_count):
+            component_x, component_y, component_width, component_height = component_stats[component, :4]
+            x_start = max(int(component_x) * scale - pad, 0)
+            y_start = max(int(component_y) * scale - pad, 0)
+            x_end = min((int(component_x) + int(component_width) - 1) * scale + template_width + pad, screen_width)
+            y_end = min((int(component_y) + int(component_height) - 1) * scale + template_height + pad, screen_height)
+            if x_end - x_start < template_width or y_end - y_start < template_height:
+                continue
+            window = screen_to_use[y_start:y_end, x_start:x_end]
+            fine_result = _match_template(window, template_to_use, method)
+            if method in [cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED]:
+                fine_y_coords, fine_x_coords = np.where(fine_result <= threshold)
+            else:
+                fine_y_coords, fine_x_coords = np.where(fine_result >= threshold)
+            for fine_x, fine_y in zip(fine_x_coords.tolist(), fine_y_coords.tolist()):
+                center = (x_start + fine_x + template_width // 2, y_start + fine_y + template_height // 2)
+                if center in seen_positions:
+                    continue
+                seen_positions.add(center)
+                matching_results.append({
+                    "position": center,
+                    "dimensions": (template_width, template_height),
+                    "threshold": threshold
+                })
+        if not matching_results:
+            raise RuntimeError(f"Match failed, no refined candidate reached the defined threshold {threshold}")
+        return matching_results
+    def find_templates_locations(
+            self,
+            original_image: np.ndarray,
+            original_templates: List[np.ndarray],
+            method: int = cv2.TM_CCOEFF_NORMED,
+            threshold: float = None,
+            grayscale: bool = False
+        ) -> List[List[Dict[str, any]]]:
+        """
+        Match several templates (e.g. a set of context templates) against the
+        same screen image. The screen-side preparation (grayscale conversion)
+        is done once and shared across all templates, and a template that does
+        not reach the threshold yields an empty list instead of aborting the
+        whole batch.
+
+        :param original_image: The original, unresized screen image.
+        :param original_templates: The template images to search for.
+        :param method: The method used for template matching (default: cv2.TM_CCOEFF_NORMED).
+        :param threshold: The minimum correlation value to consider a match as valid.
+        :param grayscale: If True, convert screen and templates to grayscale before matching.
+        :return: One list of match dictionaries per template, in input order.
+        """
+        screen_to_use = original_image
+        if grayscale and screen_to_use.ndim == 3:
+            screen_to_use = cv2.cvtColor(screen_to_use, cv2.COLOR_BGR2GRAY)
+
+        if method == cv2.TM_CCOEFF_NORMED and screen_to_use.ndim == 2 and len(original_templates) >= 2:
+            # Single-channel batch: pay for the screen integrals once and give
+            # each template a plain TM_CCORR pass instead of a full NCC.
+            if threshold is None:
+                raise RuntimeError("threshold is required for template matching.")
+            screen_float = screen_to_use.astype(np.float32)
+            screen_sum, screen_sumsq = cv2.integral2(screen_float)
+            batch_locations = []
+            for original_template in original_templates:
+                template_to_use = original_template
+                if template_to_use.ndim == 3:
+                    template_to_use = cv2.cvtColor(template_to_use, cv2.COLOR_BGR2GRAY)
+                match_result = _ncc_from_integrals(screen_float, screen_sum, screen_sumsq, template_to_use)
+                match_y_coords, match_x_coords = np.where(match_result >= threshold)
+                template_height, template_width = template_to_use.shape[:2]
+                center_x_coords = (match_x_coords + template_width // 2).tolist()
+                center_y_coords = (match_y_coords + template_height // 2).tolist()
+                batch_locations.append([
+                    {
+                        "position": (center_x, center_y),
+                        "dimensions": (template_width, template_height),
+                        "threshold": threshold
+                    }
+                    for center_x, center_y in zip(center_x_coords, center_y_coords)
+                ])
+            return batch_locations
+
+        batch_locations = []
+        for original_template in original_templates:
+            try:
+                batch_locations.append(
+                    self.find_template_locations(
+                        original_image=original_image,
+                        original_template=original_template,
+                        resized_image=screen_to_use,
+                        method=method,
+                        threshold=threshold,
+                        grayscale=grayscale
+                    )
+                )
+            except RuntimeError:
+                batch_locations.append([])
+        return batch_locations
+    def find_template_with_features(
+            self,
+            original_image: np.ndarray,
+            original_template: np.ndarray,
+            max_features: int = 1000,
+            ratio: float = 0.75,
+            min_matches: int = 10
+        ) -> List[Dict[str, any]]:
+        """
+        Locate the template in the screen image via ORB feature matching.
+
+        Unlike matchTemplate this tolerates moderate scale and rotation
+        differences. Descriptor matching uses FLANN with locality-sensitive
+        hashing (the binary-descriptor index) plus Lowe's ratio test, which
+        scales far better than exhaustive Hamming matching once feature
+        counts reach the thousands.
+
+        :param original_image: The original, unresized screen image.
+        :param original_template: The original, unresized template image.
+        :param max_features: Maximum number of ORB features to detect per image.
+        :param ratio: Lowe's ratio test threshold for accepting a descriptor match.
+        :param min_matches: Minimum number of good matches required for a valid result.
+        :return: A single-element list with position, size, and the good-match count.
+
+        Raises:
+        RuntimeError: If too few features or good matches are found to locate the template.
+        """
+        screen_gray = cv2.cvtColor(original_image, cv2.COLOR_BGR2GRAY) if original_image.ndim == 3 else original_image
+        template_gray = cv2.cvtColor(original_template, cv2.COLOR_BGR2GRAY) if original_template.ndim == 3 else original_template
+
+        orb = cv2.ORB_create(nfeatures=max_features)
+        screen_keypoints, screen_descriptors = orb.detectAndCompute(screen_gray, None)
+        template_keypoints, template_descriptors = orb.detectAndCompute(template_gray, None)
+        if screen_descriptors is None or template_descriptors is None or len(template_descriptors) < 2:
+            raise RuntimeError("Match failed, not enough features detected for feature matching")
+
+        flann = cv2.FlannBasedMatcher(
+            dict(algorithm=6, table_number=12, key_size=20, multi_probe_level=2), {}
+        )
+        knn_matches = flann.knnMatch(template_descriptors, screen_descriptors, k=2)
+        good_matches = [
+            pair[0] for pair in knn_matches
+            if len(pair) == 2 and pair[0].distance < ratio * pair[1].distance
+        ]
+        if len(good_matches) < min_matches:
+            raise RuntimeError(f"Match failed, only {len(good_matches)} good feature matches, {min_matches} required")
+
+        template_points = np.float32([template_keypoints[m.queryIdx].pt for m in good_matches]).reshape(-1, 1, 2)
+        screen_points = np.float32([screen_keypoints[m.trainIdx].pt for m in good_matches]).reshape(-1, 1, 2)
+        homography, _ = cv2.findHomography(template_points, screen_points, cv2.RANSAC, 5.0)
+        if homography is None:
+            raise RuntimeError("Match failed, could not estimate a homography from the feature matches")
+
+        template_height, template_width = template_gray.shape[:2]
+        template_center = np.float32([[[template_width / 2, template_height / 2]]])
+        center_x, center_y = cv2.perspectiveTransform(template_center, homography)[0, 0]
+        return [
+            {
+                "position": (int(center_x), int(center_y)),
+                "dimensions": (template_width, template_height),
+                "matches": len(good_matches)
+            }
+        ]
     def match_template_with_contexts(
             self, 
             template_matches: List[dict], 
@@ -83,12 +665,50 @@ class ImageMatcher:
 
         :param template_matches: List of dictionaries containing matching positions and related information of the template.
         :param context_matches: List of dictionaries containing context template information to check for each match.
+            Each context set should be matched against the screen exactly once by the caller
+            (find_templates_locations batches this screen-side work across all context templates);
+            this method only applies the cheap in-memory offset filter per template match.
         :param all_matching: If True, all contexts must match for a successful result; otherwise, any matching context is enough.
         :return: A list of dictionaries containing match information if matches are found, or None if no match is found.
         """
+        if not template_matches or not context_matches:
+            return []
+        # Struct-of-arrays preparation: the context dicts are unpacked into
+        # (K, 2) position/offset arrays once, instead of per template match.
+        prepared_contexts = []
+        for context_set in context_matches:
+            valid_contexts = [context for context in context_set if context.get("position")]
+            if valid_contexts:
+                context_positions = np.array([context["position"] for context in valid_contexts], dtype=np.int64)
+                context_offsets = np.array(
+                    [
+                        [context.get("offset", {}).get("x", 0), context.get("offset", {}).get("y", 0)]
+                        for context in valid_contexts
+                    ],
+                    dtype=np.int64
+                )
+            else:
+                context_positions = context_offsets = None
+            prepared_contexts.append((valid_contexts, context_positions, context_offsets))
+
         matching_results = []
         for match in template_matches:
-            context_results = self.apply_context_filters_for_template(match, context_matches, all_matching)
+            match_position = match.get('position')
+            if not match_position:
+                continue
+            match_position_array = np.asarray(match_position, dtype=np.int64)
+            context_results = []
+            for valid_contexts, context_positions, context_offsets in prepared_contexts:
+                if context_positions is None:
+                    continue
+                within_offset = (np.abs(context_positions - match_position_array) <= context_offsets).all(axis=1)
+                selected = [valid_contexts[index] for index in np.flatnonzero(within_offset)]
+                if selected:
+                    context_results.append(selected)
+                    if not all_matching:
+                        break
+            if all_matching and len(context_results) != len(context_matches):
+                context_results = None
             if context_results:
                 match["context_matches"] = context_results
                 matching_results.append(match)
@@ -116,42 +736,93 @@ class ImageMatcher:
             return None
         for context_set in context_matches:
             context_for_current_template = []
-            for context in context_set:
-                context_position = context.get("position")
-                if not context_position:
-                    continue
-                offset = context.get("offset", {"x": 0, "y": 0})
-                if abs(context_position[0] - match_position[0]) <= offset.get("x", 0) and \
-                abs(context_position[1] - match_position[1]) <= offset.get("y", 0):
-                    context_for_current_template.append(context)
+            if len(context_set) >= 16:
+                # Dense context sets: one broadcast pass over a (K, 2) array
+                # replaces K Python iterations of dict lookups and abs calls.
+                valid_contexts = [context for context in context_set if context.get("position")]
+                if valid_contexts:
+                    context_positions = np.array([context["position"] for context in valid_contexts], dtype=np.int64)
+                    context_offsets = np.array(
+                        [
+                            [context.get("offset", {}).get("x", 0), context.get("offset", {}).get("y", 0)]
+                            for context in valid_contexts
+                        ],
+                        dtype=np.int64
+                    )
+                    within_offset = (np.abs(context_positions - np.asarray(match_position, dtype=np.int64)) <= context_offsets).all(axis=1)
+                    context_for_current_template = [valid_contexts[index] for index in np.flatnonzero(within_offset)]
+            else:
+                for context in context_set:
+                    context_position = context.get("position")
+                    if not context_position:
+                        continue
+                    offset = context.get("offset", {"x": 0, "y": 0})
+                    if abs(context_position[0] - match_position[0]) <= offset.get("x", 0) and \
+                    abs(context_position[1] - match_position[1]) <= offset.get("y", 0):
+                        context_for_current_template.append(context)
             if context_for_current_template:
                 context_results.append(context_for_current_template)
+                if not all_matching:
+                    # Any one satisfied context set is enough; skip the rest.
+                    break
         if all_matching:
             if len(context_results) == len(context_matches):
                 return context_results
             else:
                 return None
         return context_results
+    @staticmethod
     def filter_nearby_matches(
         matches: List[Dict[str, Any]],
         min_distance: int = 10
     ) -> List[Dict[str, Any]]:
         """
         Filter out matches that are too close to each other based on a minimum distance.
-        
+
         :param matches: A list of match results.
         :param min_distance: The minimum distance, only matches with distance greater than this will be retained.
         :return: A filtered list of matches.
         """
-        filtered_matches = []
-        for match in matches:
-            center_x, center_y = match["position"]
-            too_close = False
-            for filtered_match in filtered_matches:
-                existing_x, existing_y = filtered_match["position"]
-                if abs(center_x - existing_x) < min_distance and abs(center_y - existing_y) < min_distance:
-                    too_close = True
-                    break
-            if not too_close:
-                filtered_matches.append(match)
-        return filtered_matches
\ No newline at end of file
+        if len(matches) < 2:
+            return list(matches)
+        positions = np.ascontiguousarray([match["position"] for match in matches], dtype=np.int32)
+        if len(matches) >= 512:
+            # Large result sets (low-threshold matches) go through OpenCV's
+            # C++ NMS. Two min_distance-sized boxes overlap exactly when both
+            # |dx| and |dy| are below min_distance, so with nms_threshold=0
+            # this reproduces the greedy per-axis filter below; strictly
+            # decreasing scores preserve the input-order greedy semantics.
+            boxes = np.empty((len(matches), 4), dtype=np.float32)
+            boxes[:, :2] = positions
+            boxes[:, 2:] = min_distance
+            scores = np.arange(len(matches), 0, -1, dtype=np.float32)
+            kept_indices = cv2.dnn.NMSBoxes(boxes, scores, score_threshold=0.0, nms_threshold=0.0)
+            kept_indices = sorted(np.asarray(kept_indices).ravel().tolist())
+            return [matches[index] for index in kept_indices]
+        if njit is not None:
+            keep = _nearby_keep_mask(positions, min_distance)
+        else:
+            # Spatial hash: with cells of min_distance, any conflicting kept
+            # match must sit in the 3x3 cell neighborhood, so each candidate
+            # compares against a handful of neighbors instead of all kept
+            # matches — O(N) on typical spread-out match sets.
+            cell_size = max(min_distance, 1)
+            grid = {}
+            keep = np.zeros(len(matches), dtype=np.bool_)
+            for index, (x, y) in enumerate(positions.tolist()):
+                cell_x, cell_y = x // cell_size, y // cell_size
+                conflict = False
+                for neighbor_x in (cell_x - 1, cell_x, cell_x + 1):
+                    for neighbor_y in (cell_y - 1, cell_y, cell_y + 1):
+                        for kept_x, kept_y in grid.get((neighbor_x, neighbor_y), ()):
+                            if abs(x - kept_x) < min_distance and abs(y - kept_y) < min_distance:
+                                conflict = True
+                                break
+                        if conflict:
+                            break
+                    if conflict:
+                        break
+                if not conflict:
+                    keep[index] = True
+                    grid.setdefault((cell_x, cell_y), []).append((x, y))
+        return [match for match, kept in zip(matches, keep) if kept]
\ No newline at end of file
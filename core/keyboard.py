@@ -1,3 +1,5 @@
+import time
+
 import pyperclip
 from typing import Optional, Literal
 import pyautogui
@@ -9,8 +11,16 @@ class KeyboardController:
         Enter the given text using the keyboard.
 
         :param text: The text to input.
-        :param delay: The delay (in seconds) between each character.
+        :param delay: The delay (in seconds) between each character. With no delay,
+            long printable text is pasted via the clipboard in one ctrl+v instead
+            of being typed character by character.
         """
+        if delay == 0 and len(text) > 32 and text.isprintable():
+            # Per-character typewrite costs a key-down/key-up round trip per
+            # char; one paste replaces hundreds of those.
+            ClipboardHandler.set_text(text)
+            pyautogui.hotkey("ctrl", "v")
+            return
         pyautogui.typewrite(text, interval=delay)
 
     @staticmethod
@@ -25,11 +35,22 @@ class KeyboardController:
         :param result_type: Specifies the type of result to return. "clipboard" returns the clipboard content, "none" returns nothing.
         :return: If `result_type` is "clipboard", returns the clipboard content; otherwise, returns None.
         """
-        pyautogui.hotkey(*keys)
-
         if result_type == "clipboard":
-            pyautogui.sleep(0.1)
+            # Poll for the clipboard to change instead of a fixed 100ms sleep;
+            # the update usually lands within a few milliseconds, so typical
+            # latency drops to the first poll interval. The 100ms deadline is
+            # kept as the fallback for targets that never update.
+            before = ClipboardHandler.get_text()
+            pyautogui.hotkey(*keys)
+            deadline = time.monotonic() + 0.1
+            while time.monotonic() < deadline:
+                current = ClipboardHandler.get_text()
+                if current != before:
+                    return current
+                time.sleep(0.002)
             return ClipboardHandler.get_text()
+
+        pyautogui.hotkey(*keys)
         return None
 
 class ClipboardHandler:
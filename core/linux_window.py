@@ -1,9 +1,10 @@
 import Xlib
 import Xlib.display
 import Xlib.X
+import Xlib.error
 import Xlib.protocol
 from typing import List, Dict, Optional, Tuple, Union
-from utils import match_title
+from core.utils import match_title
 
 """
 Xlib-based Window Manager
@@ -16,9 +17,10 @@ def send_client_message_event(
     display, 
     window, 
     client_type, 
-    data, 
-    root=None, 
-    event_mask=Xlib.X.SubstructureRedirectMask | Xlib.X.SubstructureNotifyMask
+    data,
+    root=None,
+    event_mask=Xlib.X.SubstructureRedirectMask | Xlib.X.SubstructureNotifyMask,
+    flush=True
 ):
     """
     General method for sending ClientMessage events.
@@ -26,13 +28,14 @@ def send_client_message_event(
     :param display: Xlib Display object.
     :param window: Target window object.
     :param client_type: Atom type representing the event type (e.g., _NET_WM_STATE).
-    :param data: A list of integers representing the event data. Must have a maximum length of 5.
+    :param data: A sequence of exactly 5 integers representing the event data.
     :param root: Root window object. Defaults to display.screen().root.
     :param event_mask: Event mask, defaults to SubstructureRedirectMask | SubstructureNotifyMask.
+    :param flush: Whether to flush the display after sending. Callers that
+        send several events in a row pass False and flush once themselves.
     """
-    if len(data) > 5:
-        raise ValueError("Data length cannot exceed 5.")
-    data = (data + [0] * (5 - len(data)))[:5]  # Pad to 5 integers.
+    if len(data) != 5:
+        raise ValueError("Data must contain exactly 5 integers.")
     event = Xlib.protocol.event.ClientMessage(
         window=window,
         client_type=client_type,
@@ -41,15 +44,63 @@ def send_client_message_event(
     if root is None:
         root = display.screen().root
     root.send_event(event, event_mask=event_mask)
-    display.flush()
+    if flush:
+        display.flush()
 
 class WindowManager:
-    def __init__(self):
+    #: Atoms the manager uses; interned once on startup since every
+    #: ``intern_atom`` call is a synchronous round-trip to the X server.
+    _ATOM_NAMES = (
+        "_NET_CLIENT_LIST",
+        "_NET_WM_NAME",
+        "WM_CLASS",
+        "_NET_WM_STATE",
+        "_NET_WM_STATE_MAXIMIZED_VERT",
+        "_NET_WM_STATE_MAXIMIZED_HORZ",
+        "_NET_WM_STATE_HIDDEN",
+        "_NET_ACTIVE_WINDOW",
+    )
+
+    #: Accepted set_window_state values mapped to their normalized names.
+    _STATE_MAP = {
+        0: "minimized",
+        1: "normal",
+        2: "maximized",
+        "minimized": "minimized",
+        "normal": "normal",
+        "maximized": "maximized",
+        "restore": "restore"
+    }
+
+    def __init__(self, display=None):
         """
         Initialize the WindowManager with access to the X server display and root window.
+
+        :param display: An existing Xlib Display to reuse. When None, a new
+            connection is opened. Opening a connection pays the auth
+            handshake, so components living in one process should share one.
         """
-        self.display = Xlib.display.Display()
+        self.display = display if display is not None else Xlib.display.Display()
         self.root = self.display.screen().root
+        self.atoms = {name: self.display.intern_atom(name, False) for name in self._ATOM_NAMES}
+        self._window_cache = {}
+        self._client_list_cache = None
+
+    def _window_object(self, window_id: int):
+        """
+        Return the resource object for a window id, creating it on first
+        use. The wrappers are plain id holders, so a stale entry for a
+        destroyed window is harmless; caching avoids allocating a fresh
+        wrapper for every decorated call.
+
+        :param window_id: The window handle.
+        :return: The cached window resource object.
+        """
+        window = self._window_cache.get(window_id)
+        if window is None:
+            window = self.display.create_resource_object("window", window_id)
+            self._window_cache[window_id] = window
+        return window
 
     def valid_window(func):
         """
@@ -61,12 +112,13 @@ class WindowManager:
             window_id = args[0] if len(args) > 0 else kwargs.get("window_id")
             if window_id is None:
                 raise ValueError("Invalid window ID: None")
+            # No probe request here: the wrapped method's own X calls fail
+            # on a bad id anyway, so validating up front only added an
+            # extra round-trip to every call.
             try:
-                window = self.display.create_resource_object("window", window_id)
-                window.get_attributes()
-            except:
+                return func(self, *args, **kwargs)
+            except Xlib.error.XError:
                 raise ValueError(f"Invalid window ID: {window_id}")
-            return func(self, *args, **kwargs)
         return wrapper
 
     def _root(self) -> List[int]:
@@ -78,18 +130,22 @@ class WindowManager:
         window_objs = self.root.query_tree().children
         return [window.id for window in window_objs]
 
-    def _all_window(self) -> List[int]:
+    def _all_window(self, refresh: bool = True) -> List[int]:
         """
         Retrieve all application window handles.
 
+        :param refresh: When False, reuse the list from the last query
+            instead of asking the server again. _NET_CLIENT_LIST rarely
+            changes, so callers issuing several lookups in a row can skip
+            the repeated round-trip.
         :return: A list of window IDs for all client windows.
         """
-        _net_client_list = self.display.get_atom('_NET_CLIENT_LIST')
-        client_list = self.root.get_full_property(
-            _net_client_list,
-            Xlib.X.AnyPropertyType,
-        ).value
-        return client_list
+        if refresh or self._client_list_cache is None:
+            self._client_list_cache = self.root.get_full_property(
+                self.atoms["_NET_CLIENT_LIST"],
+                Xlib.X.AnyPropertyType,
+            ).value
+        return self._client_list_cache
 
     @valid_window
     def _all_child_window(self, window_id: int) -> List[int]:
@@ -99,7 +155,7 @@ class WindowManager:
         :param window_id: The parent window handle.
         :return: A list of child window handles.
         """
-        window = self.display.create_resource_object("window", window_id)
+        window = self._window_object(window_id)
         child_window_objs = window.query_tree().children
         return [window.id for window in child_window_objs]
 
@@ -111,8 +167,8 @@ class WindowManager:
         :param window_id: The window handle.
         :return: The window title as a string.
         """
-        window = self.display.create_resource_object("window", window_id)
-        title = window.get_full_property(self.display.intern_atom('_NET_WM_NAME'), 0)
+        window = self._window_object(window_id)
+        title = window.get_full_property(self.atoms["_NET_WM_NAME"], 0)
         return title.value if title else ""
 
     @valid_window
@@ -123,8 +179,8 @@ class WindowManager:
         :param window_id: The window handle.
         :return: The window class name as a string.
         """
-        window = self.display.create_resource_object("window", window_id)
-        cls = window.get_full_property(self.display.intern_atom('WM_CLASS'), Xlib.X.AnyPropertyType)
+        window = self._window_object(window_id)
+        cls = window.get_full_property(self.atoms["WM_CLASS"], Xlib.X.AnyPropertyType)
         if cls:
             class_name = cls.value[0] if cls.value else ""
             return class_name
@@ -139,18 +195,22 @@ class WindowManager:
         :param window_id: The window handle.
         :return: A tuple containing (x, y, height, width).
         """
-        window = self.display.create_resource_object("window", window_id)
+        window = self._window_object(window_id)
+        return self._window_region_of(window)
+
+    def _window_region_of(self, window) -> Tuple[int, int, int, int]:
+        """
+        Compute the root-relative geometry of an existing window object.
+
+        :param window: The window resource object.
+        :return: A tuple containing (x, y, width, height).
+        """
         geom = window.get_geometry()
-        (x, y) = (geom.x, geom.y)
-        while True:
-            parent = window.query_tree().parent
-            pgeom = parent.get_geometry()
-            x += pgeom.x
-            y += pgeom.y
-            if parent.id == self.root.id:
-                break
-            window = parent
-        return x, y, geom.width, geom.height
+        # One TranslateCoordinates request gives the origin in root
+        # coordinates, replacing the query_tree/get_geometry walk that cost
+        # two round-trips per level of the parent chain.
+        coords = self.root.translate_coords(window, 0, 0)
+        return coords.x, coords.y, geom.width, geom.height
 
     @valid_window
     def _is_window_visible(self, window_id: int) -> bool:
@@ -160,7 +220,7 @@ class WindowManager:
         :param window_id: The window handle.
         :return: True if the window is visible, False otherwise.
         """
-        window = self.display.create_resource_object("window", window_id)
+        window = self._window_object(window_id)
         attributes = window.get_attributes()
         return attributes.map_state == Xlib.X.IsViewable
 
@@ -177,75 +237,49 @@ class WindowManager:
                     - 'restore': Restore the window.
         """
 
-        state_map = {
-            0: "minimized",
-            1: "normal",
-            2: "maximized",
-            "minimized": "minimized",
-            "normal": "normal",
-            "maximized": "maximized",
-            "restore": "restore"
-        }
-        if state not in state_map:
-            raise ValueError(f"Invalid window state: {state}. Valid value: {list(state_map.keys())}")
-        normalized_state = state_map[state]
+        if state not in self._STATE_MAP:
+            raise ValueError(f"Invalid window state: {state}. Valid value: {list(self._STATE_MAP.keys())}")
+        normalized_state = self._STATE_MAP[state]
 
-        _net_wm_state_max_vert = self.display.intern_atom("_NET_WM_STATE_MAXIMIZED_VERT", False)
-        _net_wm_state_max_horz = self.display.intern_atom("_NET_WM_STATE_MAXIMIZED_HORZ", False)
-        _net_wm_state_hidden = self.display.intern_atom("_NET_WM_STATE_HIDDEN", False)
-        _net_wm_state = self.display.intern_atom("_NET_WM_STATE", False)
+        _net_wm_state_max_vert = self.atoms["_NET_WM_STATE_MAXIMIZED_VERT"]
+        _net_wm_state_max_horz = self.atoms["_NET_WM_STATE_MAXIMIZED_HORZ"]
+        _net_wm_state_hidden = self.atoms["_NET_WM_STATE_HIDDEN"]
+        _net_wm_state = self.atoms["_NET_WM_STATE"]
 
-        window = self.display.create_resource_object("window", window_id)
-        
+        window = self._window_object(window_id)
+
+        # Collect every _NET_WM_STATE transition first, then emit the whole
+        # sequence as one unflushed burst so the window manager wakes up
+        # once for the complete change.
+        transitions = []
         if normalized_state in ["maximized", "normal"]:
             # First check whether it is minimized (hidden state), and if so, restore
             wm_state = window.get_full_property(_net_wm_state, Xlib.X.AnyPropertyType)
             if wm_state and _net_wm_state_hidden in wm_state.value:
-                send_client_message_event(
-                    self.display,
-                    window, 
-                    client_type=self.display.intern_atom("_NET_WM_STATE", False),
-                    data=[0, _net_wm_state_max_vert, _net_wm_state_max_horz],
-                    root=self.root
-                )
+                transitions.append((0, _net_wm_state_max_vert, _net_wm_state_max_horz, 0, 0))
 
         if normalized_state == "maximized":
-            send_client_message_event(
-                self.display, 
-                window, 
-                client_type=self.display.intern_atom("_NET_WM_STATE", False),
-                data=[1, _net_wm_state_max_vert, _net_wm_state_max_horz], 
-                root=self.root
-            )
+            transitions.append((1, _net_wm_state_max_vert, _net_wm_state_max_horz, 0, 0))
         elif normalized_state == "minimized":
-            send_client_message_event(
-                self.display, 
-                window, 
-                client_type=self.display.intern_atom("_NET_WM_STATE", False),
-                data=[1, _net_wm_state_hidden], 
-                root=self.root
-            )
+            transitions.append((1, _net_wm_state_hidden, 0, 0, 0))
         elif normalized_state == "restore":
             # Remove on recovery _NET_WM_STATE_HIDDEN
-            send_client_message_event(
-                self.display, 
-                window, 
-                client_type=self.display.intern_atom("_NET_WM_STATE", False),
-                data=[0, _net_wm_state_hidden], 
-                root=self.root
-            )
+            transitions.append((0, _net_wm_state_hidden, 0, 0, 0))
         elif normalized_state == "normal":
             # Make sure to remove the maximized state
+            transitions.append((0, _net_wm_state_max_vert, _net_wm_state_max_horz, 0, 0))
+
+        for data in transitions:
             send_client_message_event(
-                self.display, 
-                window, 
-                client_type=self.display.intern_atom("_NET_WM_STATE", False),
-                data=[0, _net_wm_state_max_vert, _net_wm_state_max_horz], 
-                root=self.root
+                self.display,
+                window,
+                client_type=_net_wm_state,
+                data=data,
+                root=self.root,
+                flush=False
             )
-        else:
-            raise ValueError(f"Unknown window state: {normalized_state}")
-        
+        self.display.flush()
+
     @valid_window
     def set_window_topmost(self, window_id: int, topmost: bool = True) -> None:
         """
@@ -253,7 +287,7 @@ class WindowManager:
         :param window_id: Window handle.
         :param topmost: True to set the window as topmost, False to cancel topmost.
         """
-        window = self.display.create_resource_object("window", window_id)
+        window = self._window_object(window_id)
         if topmost:
             window.configure(stack_mode=Xlib.X.Above)
         else:
@@ -275,35 +309,39 @@ class WindowManager:
         :param visible: True to show the window, False to hide the window.
         """
 
-        _net_wm_state_hidden = self.display.intern_atom('_NET_WM_STATE_HIDDEN', False)
-        window = self.display.create_resource_object('window', window_id)
+        _net_wm_state_hidden = self.atoms["_NET_WM_STATE_HIDDEN"]
+        _net_wm_state = self.atoms["_NET_WM_STATE"]
+        window = self._window_object(window_id)
         event_mask = Xlib.X.SubstructureRedirectMask | Xlib.X.SubstructureNotifyMask
         if visible:
             send_client_message_event(
                 self.display, 
                 window, 
-                client_type=self.display.intern_atom("_NET_WM_STATE", False),
-                data=[0, _net_wm_state_hidden], 
+                client_type=_net_wm_state,
+                data=(0, _net_wm_state_hidden, 0, 0, 0),
                 root=self.root,
-                event_mask=event_mask
+                event_mask=event_mask,
+                flush=False
             )
             send_client_message_event(
                 self.display, 
                 window, 
-                client_type=self.display.intern_atom("_NET_ACTIVE_WINDOW", False),
-                data=[1, Xlib.X.CurrentTime, 0, 0, 0],
+                client_type=self.atoms["_NET_ACTIVE_WINDOW"],
+                data=(1, Xlib.X.CurrentTime, 0, 0, 0),
                 root=self.root,
-                event_mask=event_mask
+                event_mask=event_mask,
+                flush=False
             )
             window.map()
         else:
             send_client_message_event(
                 self.display, 
                 window, 
-                client_type=self.display.intern_atom("_NET_WM_STATE", False),
-                data=[1, _net_wm_state_hidden], 
+                client_type=_net_wm_state,
+                data=(1, _net_wm_state_hidden, 0, 0, 0),
                 root=self.root,
-                event_mask=event_mask
+                event_mask=event_mask,
+                flush=False
             )
             window.unmap()
         self.display.flush()
@@ -311,17 +349,35 @@ class WindowManager:
     def _get_window_info(self, window_id: int) -> Dict[str, any]:
         """
         Get detailed information about a single window.
+
+        The window resource object is created once and queried directly
+        rather than through the decorated per-id helpers, which each
+        recreate the object and pay an extra validation round-trip.
+        """
+        return self._window_info_of(self._window_object(window_id))
+
+    def _window_info_of(self, window) -> Dict[str, any]:
         """
-        title = self._window_title(window_id)
-        class_name = self._window_class_name(window_id)
-        region = self._get_window_region(window_id)
-        visible = self._is_window_visible(window_id)
+        Collect the detail dictionary for an existing window object.
+
+        :param window: The window resource object.
+        :return: A dictionary containing detailed information about the window.
+        """
+        window_id = window.id
+        try:
+            title = window.get_full_property(self.atoms["_NET_WM_NAME"], 0)
+            cls = window.get_full_property(self.atoms["WM_CLASS"], Xlib.X.AnyPropertyType)
+            region = self._window_region_of(window)
+            attributes = window.get_attributes()
+        except:
+            raise ValueError(f"Invalid window ID: {window_id}")
+        class_name = (cls.value[0] if cls.value else "") if cls else ""
         return {
             "window_id": window_id,
-            "title": title,
+            "title": title.value if title else "",
             "class_name": class_name,
             "region": region,
-            "visible": visible,
+            "visible": attributes.map_state == Xlib.X.IsViewable,
             "enabled": "",
         }
 
@@ -348,8 +404,14 @@ class WindowManager:
         :param window_id: Parent window handle.
         :return: A dictionary containing detailed information about the parent and its child windows.
         """
-        child_windows = self._all_child_window(window_id)
-        child_info_list = [self._get_window_info(child_window_id) for child_window_id in child_windows]
+        # query_tree already hands back child resource objects; querying
+        # them directly skips one object lookup per child.
+        window = self._window_object(window_id)
+        try:
+            children = window.query_tree().children
+        except Xlib.error.XError:
+            raise ValueError(f"Invalid window ID: {window_id}")
+        child_info_list = [self._window_info_of(child) for child in children]
         return {"window_id": window_id, "child_window": child_info_list}
     
 
@@ -400,9 +462,11 @@ class WindowManager:
         """
         linux close window for window_id
         """
-        window = self.display.create_resource_object('window', window_id)
+        window = self._window_object(window_id)
         window.destroy()
-        self.display.sync()
+        # Fire-and-forget: flush writes the request without blocking on a
+        # server round-trip the way sync() does.
+        self.display.flush()
         return True
 
     def display_cursor(self, display = False):
@@ -413,4 +477,4 @@ class WindowManager:
         """
         event_mask = Xlib.X.EnterWindowMask if display else Xlib.X.LeaveWindowMask
         self.root.change_attributes(event_mask=event_mask)
-        self.display.sync()
+        self.display.flush()
